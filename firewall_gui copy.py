@@ -1,44 +1,152 @@
 import sys
+import os
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import importlib.util
+import shutil
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QTextEdit, QPushButton, QLabel, QProgressBar,
                             QMessageBox, QFrame)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QPalette, QColor, QTextCursor
 from langchain_ollama import OllamaLLM
-import re
-from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import ahocorasick
+import re2
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
-from transformers import pipeline
-import numpy as np
+from operator import itemgetter
 import time  # Add at the top with other imports
 
+# Log through a queue so callers never block on stdout; a listener thread does the writes
+log = logging.getLogger("ai_firewall")
+log.setLevel(logging.INFO)
+LOG_QUEUE = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(LOG_QUEUE))
+LOG_LISTENER = logging.handlers.QueueListener(LOG_QUEUE, logging.StreamHandler())
+LOG_LISTENER.start()
+atexit.register(LOG_LISTENER.stop)
+
 # Constants for vulnerable setup
 CACHE_SIZE = 50  # Reduced cache size
 CONFIDENCE_THRESHOLD = 0.3  # Lower threshold for more permissive behavior
+RESPONSE_CACHE_SIZE = 256  # LLM responses kept in memory, keyed by prompt hash
+SENTIMENT_CACHE_SIZE = 4096  # Memoized sentiment scores, so repeated prompts skip the model
+RESULT_CACHE_SIZE = 32  # Finished checks the GUI replays when the same prompt is resubmitted
+SUBMIT_THROTTLE_MS = 300  # Extra "Check Input" clicks within this window are ignored
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+# INT8 ONNX export, created on first run in a per-user cache so every launch directory shares it
+SENTIMENT_ONNX_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ai_firewall", "distilbert-sst2-int8")
+SENTIMENT_ONNX_FILE = "model_quantized.onnx"
+SENTIMENT_THREADS = max(1, (os.cpu_count() or 2) // 2)  # Leave cores free for Ollama and the GUI
+# Sentiment needs transformers; pass --no-sentiment to skip loading it altogether
+SENTIMENT_ENABLED = "--no-sentiment" not in sys.argv
+if SENTIMENT_ENABLED and importlib.util.find_spec("transformers") is None:
+    log.warning("transformers is not installed; sentiment analysis is disabled")
+    SENTIMENT_ENABLED = False
 BLOCKLIST = [
     'hack', 'exploit', 'vulnerability', 'malware', 'virus', 
     'backdoor', 'rootkit', 'keylogger', 'phishing', 'ddos',
     'botnet', 'ransomware', 'trojan', 'worm', 'spyware'
 ]
+BLOCKLIST_SET = frozenset(word.lower() for word in BLOCKLIST)
+
+# Add semantic categories for harmful intent
+HARMFUL_INTENTS = {
+    'malicious': ['hack', 'exploit', 'attack', 'steal', 'breach'],
+    'destructive': ['destroy', 'delete', 'remove', 'corrupt'],
+    'deceptive': ['bypass', 'override', 'ignore', 'trick'],
+    'system': ['sudo', 'chmod', 'rm -rf', 'format'],
+}
+
+# Intent categories each (lowercased) keyword belongs to, for bucketing automaton hits
+KEYWORD_INTENTS = {}
+for category, words in HARMFUL_INTENTS.items():
+    for word in words:
+        KEYWORD_INTENTS.setdefault(word.lower(), []).append(category)
+
+# Literal alternations from the dangerous prompt rules; matched by the keyword automaton
+# on the case-folded scan text, in place of the old (?i) regexes
+DANGEROUS_KEYWORDS = [
+    frozenset(['system:', '<|system|', 'admin:', 'root:']),  # System commands
+    frozenset(['exec', 'eval', 'system', 'command', 'cmd', 'powershell', 'bash']),  # Code execution
+]
 
-# Add regex patterns for dangerous prompts
+# Add regex patterns for dangerous prompts that need more than a keyword match
 DANGEROUS_PATTERNS = [
-    r"(?i)(system:|<\|system\||admin:|root:)",  # System commands
-    r"(?i)(ignore|override|bypass).*?(instruction|restriction|rule|filter)",  # Bypass attempts
-    r"(?i)(delete|remove|drop|destroy).*?(file|data|system|database)",  # Destructive actions
-    r"(?i)(exec|eval|system|command|cmd|powershell|bash)",  # Code execution
+    r"(ignore|override|bypass).*?(instruction|restriction|rule|filter)",  # Bypass attempts
+    r"(delete|remove|drop|destroy).*?(file|data|system|database)",  # Destructive actions
 ]
 
-# Compile patterns
-DANGER_REGEX = [re.compile(pattern) for pattern in DANGEROUS_PATTERNS]
+# Compile patterns with RE2 so the lazy .*? gaps match in linear time (no ReDoS);
+# they run against the scan text below, which is far cheaper than case-insensitive matching
+DANGER_REGEX = [re2.compile(pattern) for pattern in DANGEROUS_PATTERNS]
 
-SQL_INJECTION_REGEX = re.compile(r"")  # Disabled regex check
+# casefold() already folds 'ſ' to 's'; also fold dotless 'ı' and drop the combining dot
+# 'İ' leaves behind, so everything a (?i) match accepted still matches
+SCAN_TRANSLATION = str.maketrans({"\u0131": "i", "\u0307": None})
+
+def scan_text(text: str) -> str:
+    """Case-folded prompt that the keyword automaton and danger patterns run against"""
+    return text.casefold().translate(SCAN_TRANSLATION)
+
+# Aho-Corasick automaton over every keyword: one pass over the text finds all hits
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for keyword in {*BLOCKLIST_SET, *KEYWORD_INTENTS, *(word for words in DANGEROUS_KEYWORDS for word in words)}:
+    KEYWORD_AUTOMATON.add_word(keyword, keyword)
+KEYWORD_AUTOMATON.make_automaton()
 
 # Update Ollama initialization
 llm = OllamaLLM(
     model="phi",  
 )
 
+# Generated responses keyed by prompt digest, so a repeated prompt never hits Ollama twice
+RESPONSE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+
+def prompt_key(text: str) -> bytes:
+    """Fixed-size digest of a prompt, used as a cache key"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Shared HTTP session for firewall API requests, built on first use"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(
+        max_retries=Retry(
+            total=3,              # Increase retry attempts
+            backoff_factor=1.0,   # Longer wait between retries
+            status_forcelist=[500, 502, 503, 504]
+        ),
+        pool_connections=5,    # Reduced pool size for less memory usage
+        pool_maxsize=5
+    ))
+    atexit.register(session.close)
+    return session
+
+# Status label styles; only re-applied when the status colour changes
+ALLOWED_STATUS_STYLE = "color: green; font-weight: bold;"
+BLOCKED_STATUS_STYLE = "color: red; font-weight: bold;"
+
+# Reason line templates, bound once
+REASON_WITH_SCORE_FMT = "{}\n(Score: {:.2f} | {})".format
+REASON_FMT = "{}\n({})".format
+PROCESSING_TIME_FMT = "Processing Time: {:.2f}s".format
+
+# Response footer templates
+PROCESSED_FOOTER_FMT = "[Processed in {:.2f} seconds]".format
+RESPONSE_WITH_FOOTER_FMT = "{}\n\n{}".format
+
+# Fields every LocalProcessWorker result carries, fetched in one call
+RESULT_FIELDS = itemgetter("status", "reason", "score", "response", "processing_time")
+
 # Add theme styles
 DARK_STYLE = """
 QMainWindow, QWidget {
@@ -110,19 +218,75 @@ QProgressBar::chunk {
 }
 """
 
-# Load NLP models
-try:
-    sentiment_analyzer = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
-except Exception as e:
-    print(f"Error loading NLP models: {e}")
-
-# Add semantic categories for harmful intent
-HARMFUL_INTENTS = {
-    'malicious': ['hack', 'exploit', 'attack', 'steal', 'breach'],
-    'destructive': ['destroy', 'delete', 'remove', 'corrupt'],
-    'deceptive': ['bypass', 'override', 'ignore', 'trick'],
-    'system': ['sudo', 'chmod', 'rm -rf', 'format'],
-}
+def load_sentiment_analyzer():
+    """Sentiment pipeline in FP16 on CUDA/MPS, else INT8 ONNX Runtime, else PyTorch FP32"""
+    import torch
+    from transformers import AutoTokenizer, pipeline
+    if torch.cuda.is_available() or torch.backends.mps.is_available():
+        device = "cuda:0" if torch.cuda.is_available() else "mps"
+        return pipeline("sentiment-analysis", model=SENTIMENT_MODEL,
+                        device=device, torch_dtype=torch.float16)
+
+    try:
+        from onnxruntime import SessionOptions
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError:
+        torch.set_num_threads(SENTIMENT_THREADS)
+        return pipeline("sentiment-analysis", model=SENTIMENT_MODEL)
+
+    if not os.path.isfile(os.path.join(SENTIMENT_ONNX_DIR, SENTIMENT_ONNX_FILE)):
+        # One-off export and dynamic INT8 quantization, staged in a fixed directory and moved
+        # into place only when complete. The preload thread is a daemon, so an export cut short
+        # by closing the window leaves its staging directory behind; the next run clears it
+        staging_dir = SENTIMENT_ONNX_DIR + ".partial"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        os.makedirs(os.path.dirname(SENTIMENT_ONNX_DIR), exist_ok=True)
+        model = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True)
+        ORTQuantizer.from_pretrained(model).quantize(
+            save_dir=staging_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        )
+        AutoTokenizer.from_pretrained(SENTIMENT_MODEL).save_pretrained(staging_dir)
+        shutil.rmtree(SENTIMENT_ONNX_DIR, ignore_errors=True)  # Leftover partial export
+        os.replace(staging_dir, SENTIMENT_ONNX_DIR)
+
+    session_options = SessionOptions()
+    session_options.intra_op_num_threads = SENTIMENT_THREADS
+    model = ORTModelForSequenceClassification.from_pretrained(
+        SENTIMENT_ONNX_DIR,
+        file_name=SENTIMENT_ONNX_FILE,
+        session_options=session_options
+    )
+    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_ONNX_DIR)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+# NLP models load lazily, off the startup path
+sentiment_analyzer = None
+SENTIMENT_LOCK = threading.Lock()
+
+def get_sentiment_analyzer():
+    """Load the sentiment pipeline once; None when disabled or it failed to load"""
+    global sentiment_analyzer, SENTIMENT_ENABLED
+    with SENTIMENT_LOCK:
+        if sentiment_analyzer is None and SENTIMENT_ENABLED:
+            try:
+                sentiment_analyzer = load_sentiment_analyzer()
+                sentiment_analyzer("warm up")  # Pay one-off kernel/allocator setup before the first prompt
+            except Exception as e:
+                log.error("Error loading NLP models: %s", e)
+                sentiment_analyzer = None
+                SENTIMENT_ENABLED = False
+        return sentiment_analyzer
+
+@lru_cache(maxsize=SENTIMENT_CACHE_SIZE)
+def score_sentiment(text: str) -> float:
+    """Negative-sentiment score for a prompt (0 when positive or sentiment is disabled)"""
+    analyzer = get_sentiment_analyzer()
+    if analyzer is None:
+        return 0
+    sentiment = analyzer(text)[0]
+    return sentiment['score'] if sentiment['label'] == 'NEGATIVE' else 0
 
 class RequestWorker(QThread):
     finished = pyqtSignal(dict)
@@ -133,19 +297,7 @@ class RequestWorker(QThread):
         super().__init__()
         self.url = url
         self.data = data
-        
-        # Configure retry strategy with longer timeouts
-        self.session = requests.Session()
-        retries = Retry(
-            total=3,              # Increase retry attempts
-            backoff_factor=1.0,   # Longer wait between retries
-            status_forcelist=[500, 502, 503, 504]
-        )
-        self.session.mount('http://', HTTPAdapter(
-            max_retries=retries,
-            pool_connections=5,    # Reduced pool size for less memory usage
-            pool_maxsize=5
-        ))
+        self.session = get_session()
 
     def run(self):
         try:
@@ -162,13 +314,12 @@ class RequestWorker(QThread):
             self.error.emit("Request timed out after 2 minutes. Your laptop might be under heavy load.")
         except Exception as e:
             self.error.emit(f"Error: {str(e)}")
-        finally:
-            self.session.close()
 
 class LocalProcessWorker(QThread):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
     progress_update = pyqtSignal(str)
+    token_ready = pyqtSignal(str)  # Streamed response chunks
 
     def __init__(self, text: str):
         super().__init__()
@@ -183,14 +334,11 @@ class LocalProcessWorker(QThread):
 
     @lru_cache(maxsize=CACHE_SIZE)
     def rule_based_checks(self, text: str) -> Optional[str]:
-        text_lower = text.lower()
+        text_scan = scan_text(text)
         
-        if any(word in text_lower for word in BLOCKLIST):
+        if any(word in BLOCKLIST_SET for _, word in KEYWORD_AUTOMATON.iter(text_scan)):
             return "Contains blocked words"
             
-        if SQL_INJECTION_REGEX.search(text):
-            return "Potential SQL injection detected"
-            
         return None
 
     def classify_with_ollama(self, text: str) -> Dict:
@@ -204,36 +352,46 @@ class LocalProcessWorker(QThread):
             self.error.emit(f"Classification error: {str(e)}")
             return {"label": "SAFE", "score": 0.0}
 
-    def generate_response(self, text: str) -> str:
-        """Generate response using direct parameters"""
+    def generate_response(self, text: str) -> Tuple[str, bool]:
+        """Stream the response to the GUI; returns (text, whether generation completed)"""
+        key = prompt_key(text)
+        if key in RESPONSE_CACHE:
+            RESPONSE_CACHE.move_to_end(key)
+            self.token_ready.emit(RESPONSE_CACHE[key])
+            return RESPONSE_CACHE[key], True
         try:
             self.progress_update.emit("Generating response...")
-            # Use direct parameter passing
-            response = llm.invoke(
-                text
-            )
-            return response
+            chunks = []
+            for token in llm.stream(text):
+                if not self._is_running:
+                    return "".join(chunks), False  # Stopped mid-stream; don't cache a partial answer
+                chunks.append(token)
+                self.token_ready.emit(token)
+            response = "".join(chunks)
+            RESPONSE_CACHE[key] = response
+            if len(RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                RESPONSE_CACHE.popitem(last=False)
+            return response, True
         except Exception as e:
-            return f"Error generating response: {str(e)}"
+            return f"Error generating response: {str(e)}", False
 
-    def analyze_intent(self, text: str) -> Dict[str, float]:
+    def analyze_intent(self, text: str, keyword_hits: List[str],
+                       dangerous_matches: List[str]) -> Dict[str, float]:
         """Simplified text analysis without spaCy"""
         try:
             # Get sentiment score
-            sentiment = sentiment_analyzer(text)[0]
-            sentiment_score = sentiment['score'] if sentiment['label'] == 'NEGATIVE' else 0
+            sentiment_score = score_sentiment(text)
             
-            # Simple keyword matching
-            intent_scores = {}
-            text_lower = text.lower()
-            for category, keywords in HARMFUL_INTENTS.items():
-                scores = [1.0 if keyword in text_lower else 0.0 for keyword in keywords]
-                intent_scores[category] = max(scores)
+            # Simple keyword matching, bucketed from the automaton hits
+            intent_scores = dict.fromkeys(HARMFUL_INTENTS, 0.0)
+            for word in keyword_hits:
+                for category in KEYWORD_INTENTS.get(word, ()):
+                    intent_scores[category] = 1.0
             
             return {
                 'sentiment_score': sentiment_score,
                 'intent_scores': intent_scores,
-                'command_like': any(pattern.search(text) for pattern in DANGER_REGEX)
+                'command_like': bool(dangerous_matches)
             }
         except Exception as e:
             self.error.emit(f"Analysis error: {str(e)}")
@@ -242,21 +400,29 @@ class LocalProcessWorker(QThread):
     def check_malicious(self, text: str) -> Optional[Dict]:
         """Enhanced malicious content check with detailed reasons"""
         reasons = []
+        text_scan = scan_text(text)
         
-        # Check blocklist words
-        blocked_words = [word for word in BLOCKLIST if word in text.lower()]
+        # Check blocklist words (one automaton pass also collects intent and command keywords)
+        keyword_hits = list(dict.fromkeys(word for _, word in KEYWORD_AUTOMATON.iter(text_scan)))
+        blocked_words = [word for word in keyword_hits if word in BLOCKLIST_SET]
         if blocked_words:
             reasons.append(f"Contains blocked words: {', '.join(blocked_words)}")
         
-        # Check dangerous patterns
+        # Check dangerous patterns, taking the literal ones from the automaton hits
+        dangerous_matches = []
+        for keywords in DANGEROUS_KEYWORDS:
+            match = next((word for word in keyword_hits if word in keywords), None)
+            if match:
+                dangerous_matches.append(match)
         for pattern in DANGER_REGEX:
-            match = pattern.search(text)
+            match = pattern.search(text_scan)
             if match:
-                matched_text = match.group()
-                reasons.append(f"Matches dangerous pattern: '{matched_text}'")
+                dangerous_matches.append(match.group())
+        for matched_text in dangerous_matches:
+            reasons.append(f"Matches dangerous pattern: '{matched_text}'")
         
         # NLP-based analysis
-        analysis = self.analyze_intent(text)
+        analysis = self.analyze_intent(text, keyword_hits, dangerous_matches)
         
         # Check sentiment
         if analysis.get('sentiment_score', 0) > 0.8:
@@ -280,14 +446,14 @@ class LocalProcessWorker(QThread):
     def run(self):
         """Process with enhanced security checks and detailed feedback"""
         try:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             self.progress_update.emit("Analyzing input...")
             
             # Enhanced malicious content check
             check_result = self.check_malicious(self.text)
             
             # Calculate processing time
-            processing_time = time.time() - self.start_time
+            processing_time = time.perf_counter() - self.start_time
             
             if check_result["is_malicious"]:
                 detailed_reason = "\n".join([f"• {reason}" for reason in check_result["reasons"]])
@@ -296,30 +462,38 @@ class LocalProcessWorker(QThread):
                     "reason": detailed_reason,
                     "score": 1.0,
                     "response": "Input blocked for the following reasons:\n" + detailed_reason,
-                    "processing_time": processing_time
+                    "processing_time": processing_time,
+                    "cacheable": True
                 })
                 return
             
             # Process with LLM if safe
-            response = self.generate_response(self.text)
+            response, generated = self.generate_response(self.text)
             
-            processing_time = time.time() - self.start_time
+            processing_time = time.perf_counter() - self.start_time
             self.finished.emit({
                 "status": "allowed",
                 "reason": check_result["reasons"][0],
                 "score": 0.0,
                 "response": response,
-                "processing_time": processing_time
+                "processing_time": processing_time,
+                "cacheable": generated  # Failed or interrupted generations are retried, not replayed
             })
             
         except Exception as e:
-            processing_time = time.time() - self.start_time
+            processing_time = time.perf_counter() - self.start_time
             self.error.emit(f"Error: {str(e)} (Processing time: {processing_time:.2f}s)")
 
 class FirewallGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.is_dark_mode = True  # Start with dark mode
+        self._result_cache = OrderedDict()  # Prompt digest -> finished check result
+        self._pending_key = None
+        self._prompt_dirty = True  # Input edited since the prompt text was last read
+        self._last_prompt = ""
+        self._status_style = None
+        self._response_streaming = False  # First streamed token of the current request received
         self.init_ui()
         self.apply_theme()
 
@@ -353,8 +527,13 @@ class FirewallGUI(QMainWindow):
         input_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         self.input_field = QTextEdit()
         self.input_field.setMaximumHeight(100)
+        self.input_field.textChanged.connect(self.mark_prompt_dirty)
         self.submit_btn = QPushButton("Check Input")
-        self.submit_btn.clicked.connect(self.check_input)
+        self.submit_btn.clicked.connect(self.submit_throttled)
+        # Leading-edge throttle: the first click fires at once, repeats inside the window are dropped
+        self._submit_throttle = QTimer(self)
+        self._submit_throttle.setSingleShot(True)
+        self._submit_throttle.setInterval(SUBMIT_THROTTLE_MS)
         
         input_layout.addWidget(input_label)
         input_layout.addWidget(self.input_field)
@@ -396,6 +575,7 @@ class FirewallGUI(QMainWindow):
         response_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         self.response_field = QTextEdit()
         self.response_field.setReadOnly(True)
+        self.response_field.setAcceptRichText(False)  # LLM output is shown as plain text
         self.response_field.setMinimumHeight(200)
         
         response_layout.addWidget(response_label)
@@ -427,18 +607,41 @@ class FirewallGUI(QMainWindow):
             self.setStyleSheet(LIGHT_STYLE)
             self.theme_btn.setText("🌙 Dark Mode")
 
+    def submit_throttled(self):
+        """Run check_input at most once per throttle window"""
+        if self._submit_throttle.isActive():
+            return
+        self._submit_throttle.start()
+        self.check_input()
+
+    def mark_prompt_dirty(self):
+        self._prompt_dirty = True
+
     def check_input(self):
-        prompt = self.input_field.toPlainText()
+        # Only copy the document out of the editor when it changed since the last check
+        if self._prompt_dirty:
+            self._last_prompt = self.input_field.toPlainText()
+            self._prompt_dirty = False
+        prompt = self._last_prompt
         if not prompt.strip():
             QMessageBox.warning(self, "Input Required", "Please enter a prompt first.")
             return
     
+        # Replay the result of an identical earlier check
+        key = prompt_key(prompt)
+        if key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            self._pending_key = None
+            self.handle_response({**self._result_cache[key], "cached": True})
+            return
+        self._pending_key = key
+    
         # Remove length restriction check
         # Clear previous status
         self.status_message.setText("Initializing...")
         self.status_value.setText("Processing...")
         self.reason_value.setText("Please wait...")
-        self.response_field.setText("Processing your request...")
+        self.response_field.setPlainText("Processing your request...")
         
         # Disable input while processing
         self.input_field.setEnabled(False)
@@ -451,57 +654,88 @@ class FirewallGUI(QMainWindow):
         self.worker.finished.connect(self.handle_response)
         self.worker.error.connect(self.handle_error)
         self.worker.progress_update.connect(self.handle_progress)
+        self.worker.token_ready.connect(self.handle_token)
+        self._response_streaming = False
         self.worker.start()
 
     def handle_response(self, data):
         """Enhanced response handling with processing time"""
+        self.setUpdatesEnabled(False)  # Batch the widget updates below into one repaint
         try:
+            if self._pending_key is not None and data.get("cacheable"):
+                self._result_cache[self._pending_key] = data
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            self._pending_key = None
+            
+            try:
+                status, reason, score, response_text, processing_time = RESULT_FIELDS(data)
+            except KeyError:
+                # Partial result from another producer; fall back to defaults
+                status = data.get("status", "unknown")
+                reason = data.get("reason", "N/A")
+                score = data.get("score")
+                response_text = data.get("response", "")
+                processing_time = data.get("processing_time", 0)
+            
             # Status
-            self.status_value.setText(data.get("status", "unknown").title())
-            self.status_value.setStyleSheet(
-                "color: green; font-weight: bold;" if data.get("status") == "allowed" 
-                else "color: red; font-weight: bold;"
+            self.status_value.setText(status.title())
+            self.set_status_style(
+                ALLOWED_STATUS_STYLE if status == "allowed" 
+                else BLOCKED_STATUS_STYLE
             )
             
-            # Reason and Score
-            reason = data.get("reason", "N/A")
-            score = data.get("score")
-            processing_time = data.get("processing_time", 0)
-            
-            # Format the information
-            info_parts = []
-            if score is not None:
-                info_parts.append(f"Score: {score:.2f}")
-            info_parts.append(f"Processing Time: {processing_time:.2f}s")
+            # Replayed results show no timing, since nothing was processed this time
+            cached = data.get("cached", False)
+            timing = "Cached result" if cached else PROCESSING_TIME_FMT(processing_time)
             
             # Combine reason with additional information
-            full_reason = f"{reason}\n({' | '.join(info_parts)})"
+            full_reason = (REASON_WITH_SCORE_FMT(reason, score, timing) if score is not None
+                           else REASON_FMT(reason, timing))
             self.reason_value.setText(full_reason)
             
             # Response
-            response_text = data.get("response", "")
             if response_text:
-                self.response_field.setText(f"{response_text}\n\n[Processed in {processing_time:.2f} seconds]")
+                footer = "[Replayed from cache]" if cached else PROCESSED_FOOTER_FMT(processing_time)
+                self.response_field.setPlainText(RESPONSE_WITH_FOOTER_FMT(response_text, footer))
             else:
-                self.response_field.setText("No response generated.")
+                self.response_field.setPlainText("No response generated.")
                 
         finally:
             self.cleanup_request()  # Ensure cleanup happens
+            self.setUpdatesEnabled(True)  # Schedules a single repaint
 
     def handle_error(self, error_msg):
         """Enhanced error handling"""
+        self._pending_key = None
+        self.setUpdatesEnabled(False)  # Batch the widget updates below into one repaint
         try:
             self.status_value.setText("Error")
-            self.status_value.setStyleSheet("color: red; font-weight: bold;")
+            self.set_status_style(BLOCKED_STATUS_STYLE)
             self.reason_value.setText(error_msg)
-            self.response_field.setText("Failed to check input")
+            self.response_field.setPlainText("Failed to check input")
         finally:
             self.cleanup_request()  # Ensure cleanup happens
+            self.setUpdatesEnabled(True)  # Schedules a single repaint
+
+    def set_status_style(self, style):
+        """Restyle the status label, skipping Qt's stylesheet re-parse when unchanged"""
+        if style is not self._status_style:
+            self.status_value.setStyleSheet(style)
+            self._status_style = style
 
     def handle_progress(self, message):
         """Handle progress updates from worker"""
         self.status_message.setText(message)
 
+    def handle_token(self, token):
+        """Append a streamed response chunk to the response field"""
+        if not self._response_streaming:
+            self.response_field.clear()
+            self._response_streaming = True
+        self.response_field.moveCursor(QTextCursor.MoveOperation.End)
+        self.response_field.insertPlainText(token)
+
     def update_progress(self, message):
         self.progress.setFormat(message)
 
@@ -514,7 +748,7 @@ class FirewallGUI(QMainWindow):
                 self.worker.deleteLater()  # Schedule thread deletion
                 self.worker = None
             except Exception as e:
-                print(f"Cleanup error: {e}")
+                log.error("Cleanup error: %s", e)
 
         # Re-enable UI elements
         self.input_field.setEnabled(True)
@@ -526,4 +760,6 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = FirewallGUI()
     window.show()
+    # Load the sentiment model in the background so the window appears immediately
+    threading.Thread(target=get_sentiment_analyzer, daemon=True).start()
     sys.exit(app.exec())
\ No newline at end of file